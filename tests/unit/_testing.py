@@ -15,7 +15,10 @@
 """Mocks used to emulate gRPC generated objects."""
 
 
-import mock
+try:
+    from unittest import mock
+except ImportError:  # Python 2.7
+    import mock
 
 
 class _FakeStub(object):
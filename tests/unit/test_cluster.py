@@ -12,14 +12,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 
-import unittest
+try:
+    from unittest import mock
+except ImportError:  # Python 2.7
+    import mock
 
-import mock
+import pytest
+
+from google.cloud.bigtable.client import Client
+from google.cloud.bigtable.cluster import Cluster
+from google.cloud.bigtable.enums import Cluster as ClusterEnum
+from google.cloud.bigtable.enums import StorageType
+from google.cloud.bigtable_admin_v2.proto import instance_pb2 as data_v2_pb2
 
 from ._testing import _make_credentials
 
 
+PROJECT = "project"
+INSTANCE_ID = "instance-id"
+LOCATION_ID = "location-id"
+CLUSTER_ID = "cluster-id"
+CLUSTER_NAME = "projects/{}/instances/{}/clusters/{}".format(
+    PROJECT, INSTANCE_ID, CLUSTER_ID
+)
+LOCATION_PATH = "projects/{}/locations/".format(PROJECT)
+SERVE_NODES = 5
+OP_ID = 5678
+OP_NAME = "operations/projects/{}/instances/{}/clusters/{}/operations/{}".format(
+    PROJECT, INSTANCE_ID, CLUSTER_ID, OP_ID
+)
+
+
 class MultiCallableStub(object):
     """Stub for the grpc.UnaryUnaryMultiCallable interface."""
 
@@ -30,454 +55,360 @@ class MultiCallableStub(object):
     def __call__(self, request, timeout=None, metadata=None, credentials=None):
         self.channel_stub.requests.append((self.method, request))
 
-        return self.channel_stub.responses.pop()
+        return self.channel_stub.responses.popleft()
 
 
 class ChannelStub(object):
     """Stub for the grpc.Channel interface."""
 
-    def __init__(self, responses=[]):
-        self.responses = responses
+    def __init__(self, responses=None):
+        self.responses = collections.deque(responses or ())
         self.requests = []
 
     def unary_unary(self, method, request_serializer=None, response_deserializer=None):
         return MultiCallableStub(method, self)
 
 
-class TestCluster(unittest.TestCase):
+@pytest.fixture(scope="module")
+def credentials():
+    return _make_credentials()
 
-    PROJECT = "project"
-    INSTANCE_ID = "instance-id"
-    LOCATION_ID = "location-id"
-    CLUSTER_ID = "cluster-id"
-    LOCATION_ID = "location-id"
-    CLUSTER_NAME = (
-        "projects/" + PROJECT + "/instances/" + INSTANCE_ID + "/clusters/" + CLUSTER_ID
-    )
-    LOCATION_PATH = "projects/" + PROJECT + "/locations/"
-    SERVE_NODES = 5
-    OP_ID = 5678
-    OP_NAME = "operations/projects/{}/instances/{}/clusters/{}/operations/{}".format(
-        PROJECT, INSTANCE_ID, CLUSTER_ID, OP_ID
+
+@pytest.fixture(scope="module")
+def instance():
+    return _Instance(INSTANCE_ID, _Client(PROJECT))
+
+
+@pytest.fixture(scope="module")
+def cluster_pb():
+    return data_v2_pb2.Cluster(
+        name=CLUSTER_NAME,
+        location=LOCATION_PATH + LOCATION_ID,
+        state=ClusterEnum.State.RESIZING,
+        serve_nodes=SERVE_NODES,
+        default_storage_type=StorageType.SSD,
     )
 
-    @staticmethod
-    def _get_target_class():
-        from google.cloud.bigtable.cluster import Cluster
-
-        return Cluster
-
-    def _make_one(self, *args, **kwargs):
-        return self._get_target_class()(*args, **kwargs)
-
-    @staticmethod
-    def _get_target_client_class():
-        from google.cloud.bigtable.client import Client
-
-        return Client
-
-    def _make_client(self, *args, **kwargs):
-        return self._get_target_client_class()(*args, **kwargs)
-
-    def test_constructor_defaults(self):
-        client = _Client(self.PROJECT)
-        instance = _Instance(self.INSTANCE_ID, client)
-
-        cluster = self._make_one(self.CLUSTER_ID, instance)
-        self.assertEqual(cluster.cluster_id, self.CLUSTER_ID)
-        self.assertIs(cluster._instance, instance)
-        self.assertIsNone(cluster.location_id)
-        self.assertIsNone(cluster.state)
-        self.assertIsNone(cluster.serve_nodes)
-        self.assertIsNone(cluster.default_storage_type)
-
-    def test_constructor_non_default(self):
-        from google.cloud.bigtable.enums import StorageType
-        from google.cloud.bigtable.enums import Cluster
-
-        STATE = Cluster.State.READY
-        STORAGE_TYPE_SSD = StorageType.SSD
-        client = _Client(self.PROJECT)
-        instance = _Instance(self.INSTANCE_ID, client)
-
-        cluster = self._make_one(
-            self.CLUSTER_ID,
-            instance,
-            location_id=self.LOCATION_ID,
-            _state=STATE,
-            serve_nodes=self.SERVE_NODES,
-            default_storage_type=STORAGE_TYPE_SSD,
-        )
-        self.assertEqual(cluster.cluster_id, self.CLUSTER_ID)
-        self.assertIs(cluster._instance, instance)
-        self.assertEqual(cluster.location_id, self.LOCATION_ID)
-        self.assertEqual(cluster.state, STATE)
-        self.assertEqual(cluster.serve_nodes, self.SERVE_NODES)
-        self.assertEqual(cluster.default_storage_type, STORAGE_TYPE_SSD)
-
-    def test_name_property(self):
-        credentials = _make_credentials()
-        client = self._make_client(
-            project=self.PROJECT, credentials=credentials, admin=True
-        )
-        instance = _Instance(self.INSTANCE_ID, client)
-        cluster = self._make_one(self.CLUSTER_ID, instance)
-
-        self.assertEqual(cluster.name, self.CLUSTER_NAME)
-
-    def test_from_pb_success(self):
-        from google.cloud.bigtable_admin_v2.proto import instance_pb2 as data_v2_pb2
-        from google.cloud.bigtable import enums
-
-        client = _Client(self.PROJECT)
-        instance = _Instance(self.INSTANCE_ID, client)
-
-        location = self.LOCATION_PATH + self.LOCATION_ID
-        state = enums.Cluster.State.RESIZING
-        storage_type = enums.StorageType.SSD
-        cluster_pb = data_v2_pb2.Cluster(
-            name=self.CLUSTER_NAME,
-            location=location,
-            state=state,
-            serve_nodes=self.SERVE_NODES,
-            default_storage_type=storage_type,
-        )
-
-        klass = self._get_target_class()
-        cluster = klass.from_pb(cluster_pb, instance)
-        self.assertIsInstance(cluster, klass)
-        self.assertEqual(cluster._instance, instance)
-        self.assertEqual(cluster.cluster_id, self.CLUSTER_ID)
-        self.assertEqual(cluster.location_id, self.LOCATION_ID)
-        self.assertEqual(cluster.state, state)
-        self.assertEqual(cluster.serve_nodes, self.SERVE_NODES)
-        self.assertEqual(cluster.default_storage_type, storage_type)
-
-    def test_from_pb_bad_cluster_name(self):
-        from google.cloud.bigtable_admin_v2.proto import instance_pb2 as data_v2_pb2
-
-        bad_cluster_name = "BAD_NAME"
-
-        cluster_pb = data_v2_pb2.Cluster(name=bad_cluster_name)
-
-        klass = self._get_target_class()
-        with self.assertRaises(ValueError):
-            klass.from_pb(cluster_pb, None)
-
-    def test_from_pb_instance_id_mistmatch(self):
-        from google.cloud.bigtable_admin_v2.proto import instance_pb2 as data_v2_pb2
-
-        ALT_INSTANCE_ID = "ALT_INSTANCE_ID"
-        client = _Client(self.PROJECT)
-        instance = _Instance(ALT_INSTANCE_ID, client)
-
-        self.assertNotEqual(self.INSTANCE_ID, ALT_INSTANCE_ID)
-        cluster_pb = data_v2_pb2.Cluster(name=self.CLUSTER_NAME)
-
-        klass = self._get_target_class()
-        with self.assertRaises(ValueError):
-            klass.from_pb(cluster_pb, instance)
-
-    def test_from_pb_project_mistmatch(self):
-        from google.cloud.bigtable_admin_v2.proto import instance_pb2 as data_v2_pb2
-
-        ALT_PROJECT = "ALT_PROJECT"
-        client = _Client(project=ALT_PROJECT)
-        instance = _Instance(self.INSTANCE_ID, client)
-
-        self.assertNotEqual(self.PROJECT, ALT_PROJECT)
-        cluster_pb = data_v2_pb2.Cluster(name=self.CLUSTER_NAME)
-
-        klass = self._get_target_class()
-        with self.assertRaises(ValueError):
-            klass.from_pb(cluster_pb, instance)
-
-    def test___eq__(self):
-        client = _Client(self.PROJECT)
-        instance = _Instance(self.INSTANCE_ID, client)
-        cluster1 = self._make_one(self.CLUSTER_ID, instance, self.LOCATION_ID)
-        cluster2 = self._make_one(self.CLUSTER_ID, instance, self.LOCATION_ID)
-        self.assertEqual(cluster1, cluster2)
-
-    def test___eq__type_differ(self):
-        client = _Client(self.PROJECT)
-        instance = _Instance(self.INSTANCE_ID, client)
-        cluster1 = self._make_one(self.CLUSTER_ID, instance, self.LOCATION_ID)
+
+def test_constructor_defaults(instance):
+    cluster = Cluster(CLUSTER_ID, instance)
+    assert cluster.cluster_id == CLUSTER_ID
+    assert cluster._instance is instance
+    assert cluster.location_id is None
+    assert cluster.state is None
+    assert cluster.serve_nodes is None
+    assert cluster.default_storage_type is None
+
+
+def test_constructor_non_default(instance):
+    STATE = ClusterEnum.State.READY
+    STORAGE_TYPE_SSD = StorageType.SSD
+
+    cluster = Cluster(
+        CLUSTER_ID,
+        instance,
+        location_id=LOCATION_ID,
+        _state=STATE,
+        serve_nodes=SERVE_NODES,
+        default_storage_type=STORAGE_TYPE_SSD,
+    )
+    assert cluster.cluster_id == CLUSTER_ID
+    assert cluster._instance is instance
+    assert cluster.location_id == LOCATION_ID
+    assert cluster.state == STATE
+    assert cluster.serve_nodes == SERVE_NODES
+    assert cluster.default_storage_type == STORAGE_TYPE_SSD
+
+
+def test_name_property(credentials):
+    client = Client(project=PROJECT, credentials=credentials, admin=True)
+    instance = _Instance(INSTANCE_ID, client)
+    cluster = Cluster(CLUSTER_ID, instance)
+
+    assert cluster.name == CLUSTER_NAME
+
+
+def test_from_pb_success(instance, cluster_pb):
+    cluster = Cluster.from_pb(cluster_pb, instance)
+    assert isinstance(cluster, Cluster)
+    assert cluster._instance == instance
+    assert cluster.cluster_id == CLUSTER_ID
+    assert cluster.location_id == LOCATION_ID
+    assert cluster.state == ClusterEnum.State.RESIZING
+    assert cluster.serve_nodes == SERVE_NODES
+    assert cluster.default_storage_type == StorageType.SSD
+
+
+@pytest.mark.parametrize(
+    "cluster_name,instance_id,project,match",
+    [
+        ("BAD_NAME", INSTANCE_ID, PROJECT, "not in the expected format"),
+        (CLUSTER_NAME, "ALT_INSTANCE_ID", PROJECT, "Instance ID .* does not match"),
+        (CLUSTER_NAME, INSTANCE_ID, "ALT_PROJECT", "Project ID .* does not match"),
+    ],
+)
+def test_from_pb_mismatch(cluster_name, instance_id, project, match):
+    client = _Client(project)
+    instance = _Instance(instance_id, client)
+    cluster_pb = data_v2_pb2.Cluster(name=cluster_name)
+
+    with pytest.raises(ValueError, match=match):
+        Cluster.from_pb(cluster_pb, instance)
+
+
+@pytest.mark.parametrize(
+    "cluster_id1,cluster_id2,expected",
+    [
+        (CLUSTER_ID, CLUSTER_ID, True),
+        (CLUSTER_ID, None, False),
+        ("cluster_id1", "cluster_id2", False),
+    ],
+)
+def test___eq__and___ne__(instance, cluster_id1, cluster_id2, expected):
+    cluster1 = Cluster(cluster_id1, instance, LOCATION_ID)
+    if cluster_id2 is None:
         cluster2 = object()
-        self.assertNotEqual(cluster1, cluster2)
-
-    def test___ne__same_value(self):
-        client = _Client(self.PROJECT)
-        instance = _Instance(self.INSTANCE_ID, client)
-        cluster1 = self._make_one(self.CLUSTER_ID, instance, self.LOCATION_ID)
-        cluster2 = self._make_one(self.CLUSTER_ID, instance, self.LOCATION_ID)
-        comparison_val = cluster1 != cluster2
-        self.assertFalse(comparison_val)
-
-    def test___ne__(self):
-        client = _Client(self.PROJECT)
-        instance = _Instance(self.INSTANCE_ID, client)
-        cluster1 = self._make_one("cluster_id1", instance, self.LOCATION_ID)
-        cluster2 = self._make_one("cluster_id2", instance, self.LOCATION_ID)
-        self.assertNotEqual(cluster1, cluster2)
-
-    def test_reload(self):
-        from google.cloud.bigtable_admin_v2.gapic import bigtable_instance_admin_client
-        from google.cloud.bigtable_admin_v2.proto import instance_pb2 as data_v2_pb2
-        from google.cloud.bigtable.enums import StorageType
-        from google.cloud.bigtable.enums import Cluster
-
-        api = bigtable_instance_admin_client.BigtableInstanceAdminClient(mock.Mock())
-        credentials = _make_credentials()
-        client = self._make_client(
-            project=self.PROJECT, credentials=credentials, admin=True
-        )
-        STORAGE_TYPE_SSD = StorageType.SSD
-        instance = _Instance(self.INSTANCE_ID, client)
-        cluster = self._make_one(
-            self.CLUSTER_ID,
-            instance,
-            location_id=self.LOCATION_ID,
-            serve_nodes=self.SERVE_NODES,
-            default_storage_type=STORAGE_TYPE_SSD,
-        )
-
-        # Create response_pb
-        LOCATION_ID_FROM_SERVER = "new-location-id"
-        STATE = Cluster.State.READY
-        SERVE_NODES_FROM_SERVER = 10
-        STORAGE_TYPE_FROM_SERVER = StorageType.HDD
-
-        response_pb = data_v2_pb2.Cluster(
-            name=cluster.name,
-            location=self.LOCATION_PATH + LOCATION_ID_FROM_SERVER,
-            state=STATE,
-            serve_nodes=SERVE_NODES_FROM_SERVER,
-            default_storage_type=STORAGE_TYPE_FROM_SERVER,
-        )
-
-        # Patch the stub used by the API method.
-        client._instance_admin_client = api
-        instance_admin_client = client._instance_admin_client
-        instance_stub = instance_admin_client.transport
-        instance_stub.get_cluster.side_effect = [response_pb]
-
-        # Create expected_result.
-        expected_result = None  # reload() has no return value.
-
-        # Check Cluster optional config values before.
-        self.assertEqual(cluster.location_id, self.LOCATION_ID)
-        self.assertIsNone(cluster.state)
-        self.assertEqual(cluster.serve_nodes, self.SERVE_NODES)
-        self.assertEqual(cluster.default_storage_type, STORAGE_TYPE_SSD)
-
-        # Perform the method and check the result.
-        result = cluster.reload()
-        self.assertEqual(result, expected_result)
-        self.assertEqual(cluster.location_id, LOCATION_ID_FROM_SERVER)
-        self.assertEqual(cluster.state, STATE)
-        self.assertEqual(cluster.serve_nodes, SERVE_NODES_FROM_SERVER)
-        self.assertEqual(cluster.default_storage_type, STORAGE_TYPE_FROM_SERVER)
-
-    def test_exists(self):
-        from google.cloud.bigtable_admin_v2.gapic import bigtable_instance_admin_client
-        from google.cloud.bigtable_admin_v2.proto import instance_pb2 as data_v2_pb2
-        from google.cloud.bigtable.instance import Instance
-        from google.api_core import exceptions
-
-        instance_api = bigtable_instance_admin_client.BigtableInstanceAdminClient(
-            mock.Mock()
-        )
-        credentials = _make_credentials()
-        client = self._make_client(
-            project=self.PROJECT, credentials=credentials, admin=True
-        )
-        instance = Instance(self.INSTANCE_ID, client)
-
-        # Create response_pb
-        cluster_name = client.instance_admin_client.cluster_path(
-            self.PROJECT, self.INSTANCE_ID, self.CLUSTER_ID
-        )
-        response_pb = data_v2_pb2.Cluster(name=cluster_name)
-
-        # Patch the stub used by the API method.
-        client._instance_admin_client = instance_api
-        instance_admin_client = client._instance_admin_client
-        instance_stub = instance_admin_client.transport
-        instance_stub.get_cluster.side_effect = [
-            response_pb,
-            exceptions.NotFound("testing"),
-            exceptions.BadRequest("testing"),
-        ]
-
-        # Perform the method and check the result.
-        non_existing_cluster_id = "cluster-id-2"
-        alt_cluster_1 = self._make_one(self.CLUSTER_ID, instance)
-        alt_cluster_2 = self._make_one(non_existing_cluster_id, instance)
-        self.assertTrue(alt_cluster_1.exists())
-        self.assertFalse(alt_cluster_2.exists())
-        with self.assertRaises(exceptions.BadRequest):
-            alt_cluster_1.exists()
-
-    def test_create(self):
-        import datetime
-        from google.api_core import operation
-        from google.longrunning import operations_pb2
-        from google.protobuf.any_pb2 import Any
-        from google.cloud.bigtable_admin_v2.proto import (
-            bigtable_instance_admin_pb2 as messages_v2_pb2,
-        )
-        from google.cloud._helpers import _datetime_to_pb_timestamp
-        from google.cloud.bigtable.instance import Instance
-        from google.cloud.bigtable_admin_v2.types import instance_pb2
-        from google.cloud.bigtable_admin_v2.gapic import bigtable_instance_admin_client
-        from google.cloud.bigtable_admin_v2.proto import (
-            bigtable_instance_admin_pb2 as instance_v2_pb2,
-        )
-        from google.cloud.bigtable.enums import StorageType
-
-        NOW = datetime.datetime.utcnow()
-        NOW_PB = _datetime_to_pb_timestamp(NOW)
-        credentials = _make_credentials()
-        client = self._make_client(
-            project=self.PROJECT, credentials=credentials, admin=True
-        )
-        STORAGE_TYPE_SSD = StorageType.SSD
-        LOCATION = self.LOCATION_PATH + self.LOCATION_ID
-        instance = Instance(self.INSTANCE_ID, client)
-        cluster = self._make_one(
-            self.CLUSTER_ID,
-            instance,
-            location_id=self.LOCATION_ID,
-            serve_nodes=self.SERVE_NODES,
-            default_storage_type=STORAGE_TYPE_SSD,
-        )
-        expected_request_cluster = instance_pb2.Cluster(
-            location=LOCATION,
-            serve_nodes=cluster.serve_nodes,
-            default_storage_type=cluster.default_storage_type,
-        )
-        expected_request = instance_v2_pb2.CreateClusterRequest(
-            parent=instance.name,
-            cluster_id=self.CLUSTER_ID,
-            cluster=expected_request_cluster,
-        )
-
-        metadata = messages_v2_pb2.CreateClusterMetadata(request_time=NOW_PB)
-        type_url = "type.googleapis.com/{}".format(
-            messages_v2_pb2.CreateClusterMetadata.DESCRIPTOR.full_name
-        )
-        response_pb = operations_pb2.Operation(
-            name=self.OP_NAME,
-            metadata=Any(type_url=type_url, value=metadata.SerializeToString()),
-        )
-
-        # Patch the stub used by the API method.
-        channel = ChannelStub(responses=[response_pb])
-        api = bigtable_instance_admin_client.BigtableInstanceAdminClient(
-            channel=channel
-        )
-        client._instance_admin_client = api
-
-        # Perform the method and check the result.
-        result = cluster.create()
-        actual_request = channel.requests[0][1]
-
-        self.assertEqual(actual_request, expected_request)
-        self.assertIsInstance(result, operation.Operation)
-        self.assertEqual(result.operation.name, self.OP_NAME)
-        self.assertIsInstance(result.metadata, messages_v2_pb2.CreateClusterMetadata)
-
-    def test_update(self):
-        import datetime
-        from google.api_core import operation
-        from google.longrunning import operations_pb2
-        from google.protobuf.any_pb2 import Any
-        from google.cloud._helpers import _datetime_to_pb_timestamp
-        from google.cloud.bigtable_admin_v2.proto import (
-            bigtable_instance_admin_pb2 as messages_v2_pb2,
-        )
-        from google.cloud.bigtable_admin_v2.types import instance_pb2
-        from google.cloud.bigtable_admin_v2.gapic import bigtable_instance_admin_client
-        from google.cloud.bigtable.enums import StorageType
-
-        NOW = datetime.datetime.utcnow()
-        NOW_PB = _datetime_to_pb_timestamp(NOW)
-
-        credentials = _make_credentials()
-        client = self._make_client(
-            project=self.PROJECT, credentials=credentials, admin=True
-        )
-        STORAGE_TYPE_SSD = StorageType.SSD
-        instance = _Instance(self.INSTANCE_ID, client)
-        cluster = self._make_one(
-            self.CLUSTER_ID,
-            instance,
-            location_id=self.LOCATION_ID,
-            serve_nodes=self.SERVE_NODES,
-            default_storage_type=STORAGE_TYPE_SSD,
-        )
-        # Create expected_request
-        expected_request = instance_pb2.Cluster(
-            name=cluster.name, serve_nodes=self.SERVE_NODES
-        )
-
-        metadata = messages_v2_pb2.UpdateClusterMetadata(request_time=NOW_PB)
-        type_url = "type.googleapis.com/{}".format(
-            messages_v2_pb2.UpdateClusterMetadata.DESCRIPTOR.full_name
-        )
-        response_pb = operations_pb2.Operation(
-            name=self.OP_NAME,
-            metadata=Any(type_url=type_url, value=metadata.SerializeToString()),
-        )
-
-        # Patch the stub used by the API method.
-        channel = ChannelStub(responses=[response_pb])
-        api = bigtable_instance_admin_client.BigtableInstanceAdminClient(
-            channel=channel
-        )
-        client._instance_admin_client = api
-
-        # Perform the method and check the result.
-        result = cluster.update()
-        actual_request = channel.requests[0][1]
-
-        self.assertEqual(actual_request, expected_request)
-        self.assertIsInstance(result, operation.Operation)
-        self.assertEqual(result.operation.name, self.OP_NAME)
-        self.assertIsInstance(result.metadata, messages_v2_pb2.UpdateClusterMetadata)
-
-    def test_delete(self):
-        from google.protobuf import empty_pb2
-        from google.cloud.bigtable_admin_v2.gapic import bigtable_instance_admin_client
-
-        api = bigtable_instance_admin_client.BigtableInstanceAdminClient(mock.Mock())
-        credentials = _make_credentials()
-        client = self._make_client(
-            project=self.PROJECT, credentials=credentials, admin=True
-        )
-        instance = _Instance(self.INSTANCE_ID, client)
-        cluster = self._make_one(self.CLUSTER_ID, instance, self.LOCATION_ID)
-
-        # Create response_pb
-        response_pb = empty_pb2.Empty()
-
-        # Patch the stub used by the API method.
-        client._instance_admin_client = api
-        instance_admin_client = client._instance_admin_client
-        instance_stub = instance_admin_client.transport
-        instance_stub.delete_cluster.side_effect = [response_pb]
-
-        # Create expected_result.
-        expected_result = None  # delete() has no return value.
-
-        # Perform the method and check the result.
-        result = cluster.delete()
-
-        self.assertEqual(result, expected_result)
+    else:
+        cluster2 = Cluster(cluster_id2, instance, LOCATION_ID)
+
+    assert (cluster1 == cluster2) is expected
+    assert (cluster1 != cluster2) is not expected
+
+
+def test_reload(credentials):
+    from google.cloud.bigtable_admin_v2.gapic import bigtable_instance_admin_client
+
+    api = bigtable_instance_admin_client.BigtableInstanceAdminClient(mock.Mock())
+    client = Client(project=PROJECT, credentials=credentials, admin=True)
+    STORAGE_TYPE_SSD = StorageType.SSD
+    instance = _Instance(INSTANCE_ID, client)
+    cluster = Cluster(
+        CLUSTER_ID,
+        instance,
+        location_id=LOCATION_ID,
+        serve_nodes=SERVE_NODES,
+        default_storage_type=STORAGE_TYPE_SSD,
+    )
+
+    # Create response_pb
+    LOCATION_ID_FROM_SERVER = "new-location-id"
+    STATE = ClusterEnum.State.READY
+    SERVE_NODES_FROM_SERVER = 10
+    STORAGE_TYPE_FROM_SERVER = StorageType.HDD
+
+    response_pb = data_v2_pb2.Cluster(
+        name=cluster.name,
+        location=LOCATION_PATH + LOCATION_ID_FROM_SERVER,
+        state=STATE,
+        serve_nodes=SERVE_NODES_FROM_SERVER,
+        default_storage_type=STORAGE_TYPE_FROM_SERVER,
+    )
+
+    # Patch the stub used by the API method.
+    client._instance_admin_client = api
+    instance_admin_client = client._instance_admin_client
+    instance_stub = instance_admin_client.transport
+    instance_stub.get_cluster.side_effect = [response_pb]
+
+    # Create expected_result.
+    expected_result = None  # reload() has no return value.
+
+    # Check Cluster optional config values before.
+    assert cluster.location_id == LOCATION_ID
+    assert cluster.state is None
+    assert cluster.serve_nodes == SERVE_NODES
+    assert cluster.default_storage_type == STORAGE_TYPE_SSD
+
+    # Perform the method and check the result.
+    result = cluster.reload()
+    assert result == expected_result
+    assert cluster.location_id == LOCATION_ID_FROM_SERVER
+    assert cluster.state == STATE
+    assert cluster.serve_nodes == SERVE_NODES_FROM_SERVER
+    assert cluster.default_storage_type == STORAGE_TYPE_FROM_SERVER
+
+
+def test_exists(credentials):
+    from google.cloud.bigtable_admin_v2.gapic import bigtable_instance_admin_client
+    from google.cloud.bigtable.instance import Instance
+    from google.api_core import exceptions
+
+    instance_api = bigtable_instance_admin_client.BigtableInstanceAdminClient(
+        mock.Mock()
+    )
+    client = Client(project=PROJECT, credentials=credentials, admin=True)
+    instance = Instance(INSTANCE_ID, client)
+
+    # Create response_pb
+    cluster_name = client.instance_admin_client.cluster_path(
+        PROJECT, INSTANCE_ID, CLUSTER_ID
+    )
+    response_pb = data_v2_pb2.Cluster(name=cluster_name)
+
+    # Patch the stub used by the API method.
+    client._instance_admin_client = instance_api
+    instance_admin_client = client._instance_admin_client
+    instance_stub = instance_admin_client.transport
+    instance_stub.get_cluster.side_effect = [
+        response_pb,
+        exceptions.NotFound("testing"),
+        exceptions.BadRequest("testing"),
+    ]
+
+    # Perform the method and check the result.
+    non_existing_cluster_id = "cluster-id-2"
+    alt_cluster_1 = Cluster(CLUSTER_ID, instance)
+    alt_cluster_2 = Cluster(non_existing_cluster_id, instance)
+    assert alt_cluster_1.exists()
+    assert not alt_cluster_2.exists()
+    with pytest.raises(exceptions.BadRequest):
+        alt_cluster_1.exists()
+
+
+def test_create(credentials):
+    import datetime
+    from google.api_core import operation
+    from google.longrunning import operations_pb2
+    from google.protobuf.any_pb2 import Any
+    from google.cloud.bigtable_admin_v2.proto import (
+        bigtable_instance_admin_pb2 as messages_v2_pb2,
+    )
+    from google.cloud._helpers import _datetime_to_pb_timestamp
+    from google.cloud.bigtable.instance import Instance
+    from google.cloud.bigtable_admin_v2.types import instance_pb2
+    from google.cloud.bigtable_admin_v2.gapic import bigtable_instance_admin_client
+    from google.cloud.bigtable_admin_v2.proto import (
+        bigtable_instance_admin_pb2 as instance_v2_pb2,
+    )
+
+    NOW = datetime.datetime.utcnow()
+    NOW_PB = _datetime_to_pb_timestamp(NOW)
+    client = Client(project=PROJECT, credentials=credentials, admin=True)
+    STORAGE_TYPE_SSD = StorageType.SSD
+    LOCATION = LOCATION_PATH + LOCATION_ID
+    instance = Instance(INSTANCE_ID, client)
+    cluster = Cluster(
+        CLUSTER_ID,
+        instance,
+        location_id=LOCATION_ID,
+        serve_nodes=SERVE_NODES,
+        default_storage_type=STORAGE_TYPE_SSD,
+    )
+    expected_request_cluster = instance_pb2.Cluster(
+        location=LOCATION,
+        serve_nodes=cluster.serve_nodes,
+        default_storage_type=cluster.default_storage_type,
+    )
+    expected_request = instance_v2_pb2.CreateClusterRequest(
+        parent=instance.name, cluster_id=CLUSTER_ID, cluster=expected_request_cluster,
+    )
+
+    metadata = messages_v2_pb2.CreateClusterMetadata(request_time=NOW_PB)
+    type_url = "type.googleapis.com/{}".format(
+        messages_v2_pb2.CreateClusterMetadata.DESCRIPTOR.full_name
+    )
+    response_pb = operations_pb2.Operation(
+        name=OP_NAME,
+        metadata=Any(type_url=type_url, value=metadata.SerializeToString()),
+    )
+
+    # Patch the stub used by the API method.
+    channel = ChannelStub(responses=[response_pb])
+    api = bigtable_instance_admin_client.BigtableInstanceAdminClient(channel=channel)
+    client._instance_admin_client = api
+
+    # Perform the method and check the result.
+    result = cluster.create()
+    actual_request = channel.requests[0][1]
+
+    assert actual_request == expected_request
+    assert isinstance(result, operation.Operation)
+    assert result.operation.name == OP_NAME
+    assert isinstance(result.metadata, messages_v2_pb2.CreateClusterMetadata)
+
+
+def test_update(credentials):
+    import datetime
+    from google.api_core import operation
+    from google.longrunning import operations_pb2
+    from google.protobuf.any_pb2 import Any
+    from google.cloud._helpers import _datetime_to_pb_timestamp
+    from google.cloud.bigtable_admin_v2.proto import (
+        bigtable_instance_admin_pb2 as messages_v2_pb2,
+    )
+    from google.cloud.bigtable_admin_v2.types import instance_pb2
+    from google.cloud.bigtable_admin_v2.gapic import bigtable_instance_admin_client
+
+    NOW = datetime.datetime.utcnow()
+    NOW_PB = _datetime_to_pb_timestamp(NOW)
+
+    client = Client(project=PROJECT, credentials=credentials, admin=True)
+    STORAGE_TYPE_SSD = StorageType.SSD
+    instance = _Instance(INSTANCE_ID, client)
+    cluster = Cluster(
+        CLUSTER_ID,
+        instance,
+        location_id=LOCATION_ID,
+        serve_nodes=SERVE_NODES,
+        default_storage_type=STORAGE_TYPE_SSD,
+    )
+    # Create expected_request
+    expected_request = instance_pb2.Cluster(name=cluster.name, serve_nodes=SERVE_NODES)
+
+    metadata = messages_v2_pb2.UpdateClusterMetadata(request_time=NOW_PB)
+    type_url = "type.googleapis.com/{}".format(
+        messages_v2_pb2.UpdateClusterMetadata.DESCRIPTOR.full_name
+    )
+    response_pb = operations_pb2.Operation(
+        name=OP_NAME,
+        metadata=Any(type_url=type_url, value=metadata.SerializeToString()),
+    )
+
+    # Patch the stub used by the API method.
+    channel = ChannelStub(responses=[response_pb])
+    api = bigtable_instance_admin_client.BigtableInstanceAdminClient(channel=channel)
+    client._instance_admin_client = api
+
+    # Perform the method and check the result.
+    result = cluster.update()
+    actual_request = channel.requests[0][1]
+
+    assert actual_request == expected_request
+    assert isinstance(result, operation.Operation)
+    assert result.operation.name == OP_NAME
+    assert isinstance(result.metadata, messages_v2_pb2.UpdateClusterMetadata)
+
+
+def test_delete(credentials):
+    from google.protobuf import empty_pb2
+    from google.cloud.bigtable_admin_v2.gapic import bigtable_instance_admin_client
+
+    api = bigtable_instance_admin_client.BigtableInstanceAdminClient(mock.Mock())
+    client = Client(project=PROJECT, credentials=credentials, admin=True)
+    instance = _Instance(INSTANCE_ID, client)
+    cluster = Cluster(CLUSTER_ID, instance, LOCATION_ID)
+
+    # Create response_pb
+    response_pb = empty_pb2.Empty()
+
+    # Patch the stub used by the API method.
+    client._instance_admin_client = api
+    instance_admin_client = client._instance_admin_client
+    instance_stub = instance_admin_client.transport
+    instance_stub.delete_cluster.side_effect = [response_pb]
+
+    # Create expected_result.
+    expected_result = None  # delete() has no return value.
+
+    # Perform the method and check the result.
+    result = cluster.delete()
+
+    assert result == expected_result
 
 
 class _Instance(object):
+    __slots__ = ("instance_id", "_client")
+
     def __init__(self, instance_id, client):
         self.instance_id = instance_id
         self._client = client
@@ -485,8 +416,12 @@ class _Instance(object):
     def __eq__(self, other):
         return other.instance_id == self.instance_id and other._client == self._client
 
+    __hash__ = None
+
 
 class _Client(object):
+    __slots__ = ("project", "project_name", "_operations_stub")
+
     def __init__(self, project):
         self.project = project
         self.project_name = "projects/" + self.project
@@ -494,3 +429,5 @@ class _Client(object):
 
     def __eq__(self, other):
         return other.project == self.project and other.project_name == self.project_name
+
+    __hash__ = None